@@ -1,5 +1,45 @@
 from abc import ABC, abstractmethod
-from copy import deepcopy
+from _thread import allocate_lock  # what threading.Lock is, without importing threading
+from sys import intern
+
+# ----------------------------------
+# Money Helpers
+# ----------------------------------
+
+def to_cents(price) -> int:
+    """
+    Convert a dollar amount (float, str, int or Decimal) to integer cents,
+    rounding half up. Floats go through their shortest repr, so 2.675 -> 268.
+    Raises ValueError for anything that is not a finite amount.
+    """
+    if isinstance(price, int):
+        if isinstance(price, bool):
+            raise ValueError(f"Invalid price {price!r}")
+        return price * 100
+    if isinstance(price, float):
+        if price != price or price in (float("inf"), float("-inf")):
+            raise ValueError(f"Invalid price {price!r}")
+        scaled = price * 100
+        cents = round(scaled)
+        if abs(scaled - cents) < 1e-6:  # already a whole number of cents
+            return cents
+        price = repr(price)
+    if isinstance(price, str):
+        # Fast path for plain "d.dd" amounts, which is nearly every price
+        whole, _, frac = price.strip().partition(".")
+        digits = whole.lstrip("-")
+        # isdecimal, not isdigit: "²" is a digit that int() rejects
+        if digits.isdecimal() and len(frac) <= 2 and (not frac or frac.isdecimal()):
+            cents = int(digits) * 100 + int(frac.ljust(2, "0"))
+            return -cents if whole.startswith("-") else cents
+    # Rare (3+ decimal places, exponents, Decimal input): import decimal only
+    # when needed, it's one of the larger costs of importing this module
+    from decimal import Decimal, ROUND_HALF_UP
+    try:
+        return int(Decimal(price).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP) * 100)
+    except (ArithmeticError, ValueError, TypeError):  # decimal.InvalidOperation is an ArithmeticError
+        raise ValueError(f"Invalid price {price!r}") from None
+
 
 # ----------------------------------
 # Base Classes
@@ -13,7 +53,16 @@ class Component(ABC):
 
     def __init__(self, name: str, price: float):
         self.name = name               # e.g. "Wire", "Battery", "Sensor", ...
-        self.price = float(price)      # dollars and cents
+        self.price = price             # stored as integer cents, see price_cents
+
+    @property
+    def price(self) -> float:
+        """Price in dollars (derived from the exact price_cents)."""
+        return self.price_cents / 100
+
+    @price.setter
+    def price(self, value):
+        self.price_cents = to_cents(value)
 
     @abstractmethod
     def display_string(self) -> str:
@@ -45,14 +94,86 @@ class Component(ABC):
             return False
         return (
             self.name == other.name
-            and abs(self.price - other.price) < 1e-9  # float comparison
+            and self.price_cents == other.price_cents
         )
 
+    def identity(self) -> tuple:
+        """
+        Return a hashable key identifying this part: the class name plus every
+        attribute value (price as integer cents). Two components with the same
+        identity are the same part, e.g. for merging pick lists.
+        """
+        return (type(self).__name__, tuple(sorted(vars(self).items())))
+
     def __str__(self):
         """Alias for the display string."""
         return self.display_string()
 
 
+class LazyComponent(Component):
+    """
+    Base of the components created by parse_lazy_component_from_csv. Each
+    component class has a lazy subclass (LAZY_TYPES[Wire] is LazyWire, ...)
+    whose instances hold only their name and raw CSV row; the row is parsed
+    the first time a field that isn't set yet (voltage, price, ...) is read.
+
+    Parsing switches the object's class back to the plain component class, so
+    from then on it is an ordinary component. __getattr__ lives here rather
+    than on Component because defining it makes every attribute lookup on a
+    class slower, and eagerly parsed components shouldn't pay for that.
+    """
+
+    # Lazy classes are built as (Wire, LazyComponent): the component class
+    # comes first so the layouts match (required to switch __class__), and
+    # these methods still come before Component's in the MRO
+    __slots__ = ()
+
+    def __getattr__(self, attr):
+        # Only called when normal attribute lookup fails
+        if attr.startswith("__"):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{attr}'")
+        LazyComponent._materialize(self)  # self may already have been switched
+        # Either we just parsed the row, or another thread finished parsing it
+        # after our normal lookup failed: look the attribute up again
+        return getattr(self, attr)
+
+    def identity(self) -> tuple:
+        LazyComponent._materialize(self)
+        return self.identity()
+
+    def __reduce_ex__(self, protocol):
+        # Pickle and copy as the plain component class
+        LazyComponent._materialize(self)
+        return self.__reduce_ex__(protocol)
+
+    def _materialize(self):
+        """
+        Parse the raw row into the component's attributes. Safe to call from
+        several threads at once: the parsed fields are added in one update,
+        then the class is switched, and the raw row is only dropped last, so
+        a concurrent reader always finds either the row or the fields. If the
+        row is malformed it is kept and every access raises LazyParseError.
+        """
+        lazy_class = type(self)
+        state = self.__dict__
+        row = state.get("_raw_row")
+        if row is None or not issubclass(lazy_class, LazyComponent):
+            return  # already parsed (possibly by another thread)
+        text = row if isinstance(row, str) else row.decode()
+        component_class = lazy_class._component_class
+        try:
+            parsed = component_class.parse_csv(text.split(","))
+        except (ValueError, IndexError) as e:
+            raise LazyParseError(f"Invalid {component_class.__name__} row {text!r}: {e}") from None
+        state.update(parsed.__dict__)
+        self.__class__ = component_class
+        state.pop("_raw_row", None)
+
+
+class LazyParseError(ValueError):
+    """Raised when a lazily created component's raw row can't be parsed."""
+
+
 # ----------------------------------
 # Concrete Component Classes
 # ----------------------------------
@@ -461,6 +582,19 @@ class Buzzer(Component):
 # Component Factory for Parsing
 # ----------------------------------
 
+# Lower-cased CSV type name -> component class
+COMPONENT_TYPES = {
+    "wire": Wire,
+    "battery": Battery,
+    "solar panel": SolarPanel,
+    "switch": Switch,
+    "sensor": Sensor,
+    "led light": LEDLight,
+    "light globe": LightGlobe,
+    "buzzer": Buzzer,
+}
+
+
 def parse_single_component_from_csv(quantity: int, values: list):
     """
     Given a quantity and a list of strings that describe a component,
@@ -474,28 +608,93 @@ def parse_single_component_from_csv(quantity: int, values: list):
     comp_type = values[0].lower()  # "wire", "battery", etc.
 
     # Dispatch to the correct parse method based on the name:
-    if comp_type == "wire":
-        component = Wire.parse_csv(values)
-    elif comp_type == "battery":
-        component = Battery.parse_csv(values)
-    elif comp_type == "solar panel":
-        component = SolarPanel.parse_csv(values)
-    elif comp_type == "switch":
-        component = Switch.parse_csv(values)
-    elif comp_type == "sensor":
-        component = Sensor.parse_csv(values)
-    elif comp_type == "led light":
-        component = LEDLight.parse_csv(values)
-    elif comp_type == "light globe":
-        component = LightGlobe.parse_csv(values)
-    elif comp_type == "buzzer":
-        component = Buzzer.parse_csv(values)
-    else:
+    component_class = COMPONENT_TYPES.get(comp_type)
+    if component_class is None:
         raise ValueError(f"Unknown component type: {values[0]}")
+    try:
+        component = component_class.parse_csv(values)
+    except IndexError:
+        raise ValueError(f"Too few fields for {values[0]}: {','.join(values)!r}") from None
 
     return (quantity, component)
 
 
+# Bytes of a buffer split into lines at a time by iter_lazy_components_from_buffer
+LAZY_BLOCK_BYTES = 1 << 20
+
+# Component class -> its lazily parsed subclass (see LazyComponent)
+LAZY_TYPES = {
+    cls: type(f"Lazy{cls.__name__}", (cls, LazyComponent), {"_component_class": cls, "__module__": __name__})
+    for cls in COMPONENT_TYPES.values()
+}
+
+
+def _lazy_class(name: str):
+    component_class = COMPONENT_TYPES.get(name.lower())
+    if component_class is None:
+        raise ValueError(f"Unknown component type: {name}")
+    return LAZY_TYPES[component_class]
+
+
+def _new_lazy_component(lazy_class, name: str, row):
+    component = lazy_class.__new__(lazy_class)
+    component.name = name
+    component._raw_row = row
+    return component
+
+
+def parse_lazy_component_from_csv(quantity: int, row):
+    """
+    Like parse_single_component_from_csv, but only the component type and
+    name are read now. `row` is the raw component text without the quantity
+    (str, or bytes-like), e.g. "Wire,40,2.4".
+
+    The returned object is an instance of a subclass of the right component
+    class (so isinstance checks, add_component and the kit rules work
+    unchanged); its other fields are parsed from the row the first time one
+    of them is accessed.
+    """
+    if isinstance(row, str):
+        name = row.split(",", 1)[0]
+    else:
+        row = bytes(row)
+        name = row.split(b",", 1)[0].decode()
+    # Interned, so the thousands of "Wire" rows share one name string
+    return (quantity, _new_lazy_component(_lazy_class(name), intern(name), row))
+
+
+def iter_lazy_components_from_buffer(buffer):
+    """
+    Yield (quantity, lazy component) for every "quantity,Type,..." line in a
+    bytes-like buffer (e.g. a whole file read or mmapped at once). Each
+    component keeps a bytes copy of its own row only, not a view of the
+    buffer: a memoryview object is several times larger than a short row.
+    The buffer is split into lines a block at a time, so the lines of the
+    whole buffer never exist at once.
+    """
+    if not hasattr(buffer, "find"):
+        buffer = bytes(buffer)
+    types = {}  # raw type name -> (lazy class, name), shared by every row of a type
+    start = 0
+    end_of_buffer = len(buffer)
+    while start < end_of_buffer:
+        end = buffer.find(b"\n", start + LAZY_BLOCK_BYTES)
+        end = end_of_buffer if end < 0 else end + 1
+        for line in bytes(buffer[start:end]).splitlines():
+            quantity, _, row = line.partition(b",")
+            if not row:
+                if line.strip():
+                    raise ValueError(f"Malformed component line: {line!r}")
+                continue
+            raw_name = row.partition(b",")[0]
+            known = types.get(raw_name)
+            if known is None:
+                name = raw_name.decode()
+                known = types[raw_name] = (_lazy_class(name), name)
+            yield int(quantity), _new_lazy_component(known[0], known[1], row)
+        start = end
+
+
 # ----------------------------------
 # Circuit Kit Classes
 # ----------------------------------
@@ -504,31 +703,78 @@ class CircuitKit(ABC):
     """
     Base class for Circuit Kits.
     - Has a name
-    - Holds a list of (quantity, component) tuples
-    - Price is sum of each component's price * quantity
+    - Holds a tuple of (quantity, component) tuples
+    - Price is sum of each component's price * quantity (computed in integer cents)
     - Must implement add_component, remove_component, check completeness, etc.
+
+    Kits can be shared between threads. The kit's contents live in one
+    attribute, self._state = (version, components), which is never modified in
+    place: add_component / remove_component build a new tuple (one writer at
+    a time) and swap the whole state in with a single assignment. Readers
+    never take a lock; each read method works on the state it read once at
+    the start, so it always sees one consistent version of the kit.
     """
 
     def __init__(self, kit_name: str):
         self.kit_name = kit_name
-        self.components = []  # list of (quantity, Component)
+        self._state = (0, ())  # (version, tuple of (quantity, Component))
+        self._write_lock = allocate_lock()
+
+    @property
+    def components(self) -> tuple:
+        """Tuple of (quantity, Component) at the kit's current version."""
+        return self._state[1]
+
+    @property
+    def version(self) -> int:
+        """Number of changes made to the kit so far."""
+        return self._state[0]
 
     def add_component(self, quantity: int, component: Component):
-        self.components.append((quantity, component))
+        with self._write_lock:
+            version, components = self._state
+            self._state = (version + 1, components + ((quantity, component),))
 
     def remove_component(self, component: Component):
         """
         Remove the *first occurrence* of the given component from the kit list,
         ignoring quantity for simplicity. (Could be extended to handle partial removal.)
         """
-        for i, (qty, comp) in enumerate(self.components):
-            if comp == component:
-                self.components.pop(i)
-                return
+        with self._write_lock:
+            version, components = self._state
+            for i, (qty, comp) in enumerate(components):
+                if comp == component:
+                    self._state = (version + 1, components[:i] + components[i + 1:])
+                    return
+
+    def snapshot(self):
+        """
+        Return a copy of this kit frozen at its current version. It shares the
+        (immutable) components tuple, so it's cheap; use it to make several
+        calls that must agree with each other.
+        """
+        snap = object.__new__(type(self))
+        snap.__dict__.update(self.__dict__)
+        snap._write_lock = allocate_lock()
+        return snap
+
+    def __getstate__(self):
+        # Locks can't be pickled or copied; each copy gets its own
+        state = self.__dict__.copy()
+        del state["_write_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._write_lock = allocate_lock()
 
     def total_price(self) -> float:
-        """Sum of (component.price * quantity)."""
-        return sum(qty * comp.price for qty, comp in self.components)
+        """Sum of (component.price * quantity), in dollars."""
+        return self.total_price_cents() / 100
+
+    def total_price_cents(self) -> int:
+        """Exact sum of (component.price_cents * quantity)."""
+        return sum(qty * comp.price_cents for qty, comp in self.components)
 
     def total_components_count(self) -> int:
         """Sum of all quantities of components."""
@@ -588,8 +834,9 @@ class CircuitKit(ABC):
         ...
         (This can be overridden if you need more specialized formatting.)
         """
-        lines = [f"{self.summary_display()}"]
-        for qty, comp in self.components:
+        kit = self.snapshot()  # so the summary and the lines are the same version
+        lines = [f"{kit.summary_display()}"]
+        for qty, comp in kit.components:
             lines.append(f"{qty} x {comp.display_string()}")
         return "\n".join(lines)
 
@@ -612,14 +859,15 @@ class LightCircuitKit(CircuitKit):
         super().__init__("Light Circuit")
 
     def is_complete(self) -> bool:
+        components = self.components  # one consistent version
         # Check for power supply: at least one battery, no solar
-        batteries = [(q, c) for q, c in self.components if isinstance(c, Battery)]
-        solars = [(q, c) for q, c in self.components if isinstance(c, SolarPanel)]
+        batteries = [(q, c) for q, c in components if isinstance(c, Battery)]
+        solars = [(q, c) for q, c in components if isinstance(c, SolarPanel)]
         if not batteries or solars:
             return False
 
         # Must have lights
-        lights = [(q, c) for q, c in self.components if isinstance(c, Light)]
+        lights = [(q, c) for q, c in components if isinstance(c, Light)]
         if not lights:
             return False
 
@@ -638,7 +886,7 @@ class LightCircuitKit(CircuitKit):
             # (If the same colour, also check that other values match if needed.)
 
         # Must have at least one switch. All switches same type?
-        switches = [(q, c) for q, c in self.components if isinstance(c, Switch)]
+        switches = [(q, c) for q, c in components if isinstance(c, Switch)]
         if not switches:
             return False
         first_switch_type = switches[0][1].switch_type
@@ -647,13 +895,13 @@ class LightCircuitKit(CircuitKit):
                 return False
 
         # No sensors
-        sensors = [(q, c) for q, c in self.components if isinstance(c, Sensor)]
+        sensors = [(q, c) for q, c in components if isinstance(c, Sensor)]
         if sensors:
             return False
 
         # Check wires count >= number of other components
-        wire_count = sum(q for q, c in self.components if isinstance(c, Wire))
-        other_count = sum(q for q, c in self.components if not isinstance(c, Wire))
+        wire_count = sum(q for q, c in components if isinstance(c, Wire))
+        other_count = sum(q for q, c in components if not isinstance(c, Wire))
         if wire_count < other_count:
             return False
 
@@ -665,9 +913,10 @@ class LightCircuitKit(CircuitKit):
         "21 Piece Light Circuit, with 2 AA Batteries, 4 Warm Light Globes & Push Switch"
         plus the number of unique colours, the number/type of switches, etc.
         """
-        piece_count = self.total_components_count()
+        components = self.components  # one consistent version
+        piece_count = sum(q for q, _ in components)
         # Gather battery info
-        batteries = [(q, c) for q, c in self.components if isinstance(c, Battery)]
+        batteries = [(q, c) for q, c in components if isinstance(c, Battery)]
         # We assume all batteries are same type
         total_batt_qty = sum(q for q, _ in batteries)
         if batteries:
@@ -679,7 +928,7 @@ class LightCircuitKit(CircuitKit):
             battery_voltage = ""
 
         # Gather lights
-        lights = [(q, c) for q, c in self.components if isinstance(c, Light)]
+        lights = [(q, c) for q, c in components if isinstance(c, Light)]
         total_lights_qty = sum(q for q, _ in lights)
         if lights:
             first_light = lights[0][1]
@@ -701,7 +950,7 @@ class LightCircuitKit(CircuitKit):
             light_desc = "0 Lights"
 
         # Gather switches
-        switches = [(q, c) for q, c in self.components if isinstance(c, Switch)]
+        switches = [(q, c) for q, c in components if isinstance(c, Switch)]
         total_switch_qty = sum(q for q, _ in switches)
         switch_desc = ""
         if switches:
@@ -741,23 +990,24 @@ class SensorCircuitKit(CircuitKit):
         super().__init__("Sensor Circuit")
 
     def is_complete(self) -> bool:
+        components = self.components  # one consistent version
         # Must have exactly one type of power source
-        batteries = [(q, c) for q, c in self.components if isinstance(c, Battery)]
-        solars = [(q, c) for q, c in self.components if isinstance(c, SolarPanel)]
+        batteries = [(q, c) for q, c in components if isinstance(c, Battery)]
+        solars = [(q, c) for q, c in components if isinstance(c, SolarPanel)]
         if not batteries and not solars:
             return False
         if batteries and solars:
             return False  # can't have both
 
         # Must have exactly one sensor
-        sensors = [(q, c) for q, c in self.components if isinstance(c, Sensor)]
+        sensors = [(q, c) for q, c in components if isinstance(c, Sensor)]
         total_sensors = sum(q for q, _ in sensors)
         if total_sensors != 1:
             return False
 
         # Either buzzer or lights (not both)
-        buzzers = [(q, c) for q, c in self.components if isinstance(c, Buzzer)]
-        lights = [(q, c) for q, c in self.components if isinstance(c, Light)]
+        buzzers = [(q, c) for q, c in components if isinstance(c, Buzzer)]
+        lights = [(q, c) for q, c in components if isinstance(c, Light)]
         if buzzers and lights:
             return False
 
@@ -782,8 +1032,8 @@ class SensorCircuitKit(CircuitKit):
                     return False
 
         # Must have more wires than total of other components
-        wire_count = sum(q for q, c in self.components if isinstance(c, Wire))
-        others_count = sum(q for q, c in self.components if not isinstance(c, Wire))
+        wire_count = sum(q for q, c in components if isinstance(c, Wire))
+        others_count = sum(q for q, c in components if not isinstance(c, Wire))
         if wire_count <= others_count:
             return False
 
@@ -796,10 +1046,11 @@ class SensorCircuitKit(CircuitKit):
         or
         "6 Piece Sensor Circuit, with AA Battery, Dust Sensor & Red LED Light"
         """
-        piece_count = self.total_components_count()
+        components = self.components  # one consistent version
+        piece_count = sum(q for q, _ in components)
         # Identify power supply
-        batteries = [(q, c) for q, c in self.components if isinstance(c, Battery)]
-        solars = [(q, c) for q, c in self.components if isinstance(c, SolarPanel)]
+        batteries = [(q, c) for q, c in components if isinstance(c, Battery)]
+        solars = [(q, c) for q, c in components if isinstance(c, SolarPanel)]
         power_desc = ""
         if batteries:
             # Assume they're all identical
@@ -813,7 +1064,7 @@ class SensorCircuitKit(CircuitKit):
             power_desc = f"{total_solar_qty} {first_solar.name}"
 
         # Identify sensor
-        sensors = [(q, c) for q, c in self.components if isinstance(c, Sensor)]
+        sensors = [(q, c) for q, c in components if isinstance(c, Sensor)]
         sensor_desc = ""
         if sensors:
             # There's exactly one sensor
@@ -821,8 +1072,8 @@ class SensorCircuitKit(CircuitKit):
             sensor_desc = f"{s.sensor_type.capitalize()} {s.name}"
 
         # Buzzer or Lights
-        buzzers = [(q, c) for q, c in self.components if isinstance(c, Buzzer)]
-        lights = [(q, c) for q, c in self.components if isinstance(c, Light)]
+        buzzers = [(q, c) for q, c in components if isinstance(c, Buzzer)]
+        lights = [(q, c) for q, c in components if isinstance(c, Light)]
         out_desc = ""
         if buzzers:
             out_desc = "Buzzer"
@@ -832,7 +1083,7 @@ class SensorCircuitKit(CircuitKit):
             out_desc = f"{total_lights_qty} {first_light.colour.capitalize()} {first_light.name}"
 
         # Switches (could be zero or more)
-        switches = [(q, c) for q, c in self.components if isinstance(c, Switch)]
+        switches = [(q, c) for q, c in components if isinstance(c, Switch)]
         switch_desc = ""
         if switches:
             # E.g. "Toggle Switch"
@@ -851,6 +1102,15 @@ class SensorCircuitKit(CircuitKit):
         return summary
 
 
+# Lower-cased kit type name (as used in kit CSV files) -> kit class
+KIT_TYPES = {
+    "light": LightCircuitKit,
+    "light circuit": LightCircuitKit,
+    "sensor": SensorCircuitKit,
+    "sensor circuit": SensorCircuitKit,
+}
+
+
 # ----------------------------------
 # Example Usage / Testing
 # ----------------------------------
@@ -0,0 +1,93 @@
+"""
+Benchmark: inventory reservations under contention.
+
+Several workers repeatedly reserve_kit() + commit() the same kit against a
+shared Inventory until stock runs out, then the totals are checked to make
+sure nothing was oversold.
+
+Usage: python bench_inventory.py [kits_in_stock] [workers]
+"""
+
+import multiprocessing
+import sys
+import threading
+from time import perf_counter
+
+from A1_code import Battery, LightGlobe, Wire, Switch, LightCircuitKit
+from inventory import Inventory, OutOfStockError
+
+
+def make_kit():
+    kit = LightCircuitKit()
+    kit.add_component(2, Battery("AA", 1.5, 3.1))
+    kit.add_component(4, LightGlobe("warm", 6.5, 240, 3.5))
+    kit.add_component(14, Wire(60, 3.2))
+    kit.add_component(1, Switch("push", 4.5, 4.6))
+    return kit
+
+
+def stock_inventory(inventory, kit, kits_in_stock):
+    for qty, comp in kit.components:
+        inventory.add_stock(qty * kits_in_stock, comp)
+
+
+def build_until_empty(inventory) -> int:
+    """Worker: build kits until the inventory can't cover another one."""
+    kit = make_kit()
+    built = 0
+    while True:
+        try:
+            reservation = inventory.reserve_kit(kit)
+        except OutOfStockError:
+            return built
+        inventory.commit(reservation)
+        built += 1
+
+
+def run_threads(kits_in_stock, workers):
+    kit = make_kit()
+    inventory = Inventory()
+    stock_inventory(inventory, kit, kits_in_stock)
+    results = [0] * workers
+
+    def worker(i):
+        results[i] = build_until_empty(inventory)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(workers)]
+    start = perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return sum(results), perf_counter() - start, inventory
+
+
+def run_processes(kits_in_stock, workers):
+    kit = make_kit()
+    with multiprocessing.Manager() as manager:
+        inventory = Inventory.shared(manager)
+        stock_inventory(inventory, kit, kits_in_stock)
+        start = perf_counter()
+        with multiprocessing.Pool(workers) as pool:
+            built = sum(pool.map(build_until_empty, [inventory] * workers))
+        elapsed = perf_counter() - start
+        left = [inventory.on_hand(comp) for _, comp in kit.components]
+    return built, elapsed, left
+
+
+if __name__ == "__main__":
+    kits_in_stock = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    kit = make_kit()
+
+    built, elapsed, inventory = run_threads(kits_in_stock, workers)
+    assert built == kits_in_stock, built
+    assert all(inventory.on_hand(comp) == 0 for _, comp in kit.components)
+    print(f"threads:   {workers} workers built {built} kits in {elapsed:.2f}s "
+          f"({built / elapsed:,.0f} reservations/s)")
+
+    proc_kits = max(1, kits_in_stock // 10)  # Manager round trips are much slower
+    built, elapsed, left = run_processes(proc_kits, workers)
+    assert built == proc_kits and not any(left), (built, left)
+    print(f"processes: {workers} workers built {built} kits in {elapsed:.2f}s "
+          f"({built / elapsed:,.0f} reservations/s)")
@@ -0,0 +1,122 @@
+"""
+Benchmark: concurrent reads of a shared kit while it is being edited.
+
+Reader threads loop over summary_display(), total_price() and is_complete()
+on one shared kit while a writer thread keeps adding and removing a wire.
+Every read is checked against the two versions the kit alternates between,
+so a torn read (a summary or price mixing two versions) fails the run, as
+does any exception raised in a reader.
+
+Each reader count is run twice: with eagerly parsed components, and with
+lazily parsed ones (parse_lazy_component_from_csv), where the writer adds a
+freshly created lazy wire every time so readers race to parse it.
+
+Both read and write throughput are reported for 1, 2, 4, ... readers.
+Readers never lock, but under CPython's GIL all threads share one core's
+worth of bytecode execution: more readers mostly take time away from the
+writer rather than adding read capacity. Only a free-threaded build can
+show reads scaling with cores.
+
+Usage: python bench_kit_reads.py [seconds_per_run] [max_readers]
+"""
+
+import sys
+import threading
+from time import perf_counter
+
+from A1_code import (
+    Battery, LightGlobe, Wire, Switch, LightCircuitKit, parse_lazy_component_from_csv,
+)
+
+KIT_ROWS = ((2, "Battery,AA,1.5,3.1"), (4, "Light Globe,warm,6.5,240,3.5"),
+            (14, "Wire,60,3.2"), (1, "Switch,push,4.5,4.6"))
+EXTRA_ROW = "Wire,40,2.4"
+
+
+def make_kit(lazy: bool = False):
+    kit = LightCircuitKit()
+    if lazy:
+        for qty, row in KIT_ROWS:
+            kit.add_component(*parse_lazy_component_from_csv(qty, row))
+    else:
+        kit.add_component(2, Battery("AA", 1.5, 3.1))
+        kit.add_component(4, LightGlobe("warm", 6.5, 240, 3.5))
+        kit.add_component(14, Wire(60, 3.2))
+        kit.add_component(1, Switch("push", 4.5, 4.6))
+    return kit
+
+
+def make_extra(lazy: bool):
+    if lazy:
+        return parse_lazy_component_from_csv(3, EXTRA_ROW)[1]
+    return Wire(40, 2.4)
+
+
+def run(readers: int, seconds: float, lazy: bool = False):
+    # Compute the expected results on an eager kit, so the shared kit's lazy
+    # components are still unparsed when the readers start
+    kit = make_kit()
+    extra = make_extra(False)
+    # The two versions the writer switches between: (summary, cents, complete)
+    base = (kit.summary_display(), kit.total_price_cents(), kit.is_complete())
+    kit.add_component(3, extra)
+    edited = (kit.summary_display(), kit.total_price_cents(), kit.is_complete())
+    kit.remove_component(extra)
+    valid = {base, edited}
+    kit = make_kit(lazy)
+
+    stop = threading.Event()
+    counts = [0] * readers
+    errors = []
+
+    def reader(i):
+        n = 0
+        while not stop.is_set():
+            try:
+                snap = kit.snapshot()
+                result = (snap.summary_display(), snap.total_price_cents(), snap.is_complete())
+                kit.summary_display()  # plain calls on the live kit must not fail either
+                kit.total_price()
+                kit.is_complete()
+            except Exception as e:
+                errors.append(repr(e))
+                return
+            if result not in valid:
+                errors.append(result)
+                return
+            n += 1
+        counts[i] = n
+
+    def writer():
+        while not stop.is_set():
+            fresh = make_extra(lazy)
+            kit.add_component(3, fresh)
+            kit.remove_component(fresh)
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    threads.append(threading.Thread(target=writer))
+    start = perf_counter()
+    for t in threads:
+        t.start()
+    stop.wait(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    elapsed = perf_counter() - start
+    return sum(counts) / elapsed, kit.version / elapsed, errors
+
+
+if __name__ == "__main__":
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    max_readers = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+
+    for lazy in (False, True):
+        print("lazily parsed components" if lazy else "eagerly parsed components")
+        readers = 1
+        while readers <= max_readers:
+            reads, writes, errors = run(readers, seconds, lazy)
+            if errors:
+                sys.exit(f"Bad read with {readers} readers: {errors[0]}")
+            print(f"{readers:>3} readers: {reads:10,.0f} consistent reads/s, "
+                  f"writer {writes:10,.0f} versions/s")
+            readers *= 2
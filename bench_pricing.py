@@ -0,0 +1,80 @@
+"""
+Benchmark: pricing many kit lines.
+
+Compares the per-tuple generator sum that CircuitKit.total_price used to do
+against the column path in pricing.total_cents(). The old sum is timed over
+parts with a plain float price attribute, as Component had before prices
+moved to cents (Component.price is now a property), and the column path is
+timed both with and without building the columns from kits (kit_columns).
+When numpy is installed, the numpy and stdlib column paths are also timed
+and checked against each other.
+
+Usage: python bench_pricing.py [number_of_lines]
+"""
+
+import random
+import sys
+from time import perf_counter
+
+from A1_code import Wire, LightCircuitKit
+import pricing
+from pricing import PriceSchedule, DiscountTier, kit_columns, line_totals_cents, total_cents, np
+
+LINES_PER_KIT = 10
+
+
+class FloatPart:
+    """A part with a plain float price attribute, like Component before cents."""
+
+    def __init__(self, price: float):
+        self.price = price
+
+
+def _time(label, func):
+    start = perf_counter()
+    result = func()
+    elapsed = perf_counter() - start
+    print(f"{label:<36} {elapsed * 1000:9.1f} ms")
+    return result
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(42)
+    quantities = [rng.randint(1, 2000) for _ in range(n)]
+    cents = [rng.randint(1, 5000) for _ in range(n)]
+    parts = [Wire(40, c / 100) for c in range(1, 5001)]
+    float_parts = [FloatPart(c / 100) for c in range(1, 5001)]
+    lines = [(q, parts[c - 1]) for q, c in zip(quantities, cents)]
+    float_lines = [(q, float_parts[c - 1]) for q, c in zip(quantities, cents)]
+    kits = []
+    for i in range(0, n, LINES_PER_KIT):
+        kit = LightCircuitKit()
+        for q, comp in lines[i:i + LINES_PER_KIT]:
+            kit.add_component(q, comp)
+        kits.append(kit)
+    schedule = PriceSchedule([DiscountTier(100, 500), DiscountTier(1000, 1000)])
+
+    print(f"{n} lines in {len(kits)} kits, numpy {'available' if np is not None else 'not installed'}")
+    float_total = _time("old: sum q * price (float attribute)", lambda: sum(q * comp.price for q, comp in float_lines))
+    _time("sum q * price (price property)", lambda: sum(q * comp.price for q, comp in lines))
+    _time("sum q * price_cents", lambda: sum(q * comp.price_cents for q, comp in lines))
+    _time("kit_columns + total_cents", lambda: total_cents(*kit_columns(kits)))
+    _time("kit_columns only", lambda: kit_columns(kits))
+    exact = _time("total_cents (prebuilt columns)", lambda: total_cents(quantities, cents))
+    _time("total_cents (prebuilt, discounted)", lambda: total_cents(quantities, cents, schedule))
+    _time("line_totals_cents (prebuilt)", lambda: line_totals_cents(quantities, cents))
+    if np is not None:
+        # The public functions used numpy above; time the stdlib path too and
+        # check that both give the same results
+        for schedule_used in (None, schedule):
+            label = "discounted" if schedule_used else "gross"
+            stdlib_total = _time(f"stdlib total_cents ({label})",
+                                 lambda: pricing._total_cents_stdlib(quantities, cents, schedule_used))
+            stdlib_lines = _time(f"stdlib line_totals_cents ({label})",
+                                 lambda: pricing._line_totals_stdlib(quantities, cents, schedule_used))
+            assert stdlib_total == total_cents(quantities, cents, schedule_used)
+            assert stdlib_lines.tolist() == line_totals_cents(quantities, cents, schedule_used).tolist()
+        print("numpy and stdlib column paths agree")
+    print(f"float total ${float_total:.6f} vs exact {exact / 100:.2f} "
+          f"(drift {abs(float_total * 100 - exact):.6f} cents)")
@@ -0,0 +1,84 @@
+"""
+Benchmark: cold-start time of the kit command-line tool.
+
+Runs `python kit_cli.py <command>` on a small kit file many times in fresh
+interpreters and compares the median wall time with a bare `python -c pass`.
+The difference is what importing and running the tool costs per invocation,
+and is checked against STARTUP_BUDGET_MS. The slowest imports are listed
+from `python -X importtime`.
+
+Usage: python bench_startup.py [runs]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from time import perf_counter
+
+# Allowed cost of one CLI invocation on top of a bare interpreter start
+STARTUP_BUDGET_MS = 10.0
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CLI = os.path.join(HERE, "kit_cli.py")
+
+SAMPLE_KITS = """\
+k1,light,2,Battery,AA,1.5,3.1
+k1,light,4,Light Globe,warm,6.5,240,3.5
+k1,light,14,Wire,60,3.2
+k1,light,1,Switch,push,4.5,4.6
+k2,sensor,1,Solar Panel,1.4,0.4,14.00
+k2,sensor,1,Sensor,motion,5,3.9
+k2,sensor,1,Buzzer,240,90,4,120,5.6
+k2,sensor,4,Wire,40,2.4
+"""
+
+
+def median_ms(args, runs, env) -> float:
+    times = []
+    for _ in range(runs):
+        start = perf_counter()
+        subprocess.run(args, check=True, stdout=subprocess.DEVNULL, env=env)
+        times.append((perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def slowest_imports(args, env, count=8) -> list:
+    result = subprocess.run([sys.executable, "-X", "importtime"] + args[1:], env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    rows = []
+    for line in result.stderr.splitlines()[1:]:
+        _, cumulative_us, name = line.replace("import time:", "").split("|")
+        rows.append((int(cumulative_us), name.rstrip()))
+    return sorted(rows, reverse=True)[:count]
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    # Let the interpreter cache bytecode, as it would in a deployed install
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as f:
+        f.write(SAMPLE_KITS)
+    try:
+        subprocess.run([sys.executable, CLI, "summarize", f.name], check=True,
+                       stdout=subprocess.DEVNULL, env=env)  # warm-up, writes .pyc files
+        baseline = median_ms([sys.executable, "-c", "pass"], runs, env)
+        print(f"{'python -c pass':<28} {baseline:7.1f} ms")
+        worst = 0.0
+        for command in ("validate", "price", "summarize"):
+            elapsed = median_ms([sys.executable, CLI, command, f.name], runs, env)
+            worst = max(worst, elapsed - baseline)
+            print(f"{'kit_cli.py ' + command:<28} {elapsed:7.1f} ms  (+{elapsed - baseline:.1f} ms)")
+
+        print("\nSlowest imports (cumulative):")
+        for cumulative_us, name in slowest_imports([sys.executable, CLI, "summarize", f.name], env):
+            print(f"  {cumulative_us / 1000:6.2f} ms {name}")
+    finally:
+        os.unlink(f.name)
+
+    print(f"\nWorst overhead {worst:.1f} ms, budget {STARTUP_BUDGET_MS:.1f} ms")
+    if worst > STARTUP_BUDGET_MS:
+        sys.exit(f"Start-up budget exceeded by {worst - STARTUP_BUDGET_MS:.1f} ms")
@@ -0,0 +1,173 @@
+"""
+Order-level bill of materials.
+
+build_bom() merges the components of many kits (LightCircuitKit,
+SensorCircuitKit, ...) into one pick list keyed by Component.identity(),
+and in the same pass over the kits accumulates per-part quantities and
+cost in integer cents. Kits are consumed from any iterable (a generator
+works), so a large order is never copied into memory.
+
+Stock can be checked against a plain {identity: units} table or an
+Inventory, in which case units held by open reservations don't count.
+"""
+
+from inventory import Inventory
+
+# Components are usually shared between kits built from one catalog, so
+# their identity keys are cached by id() during a pass. The cache holds a
+# reference to each component (so ids can't be reused) and is cleared once
+# it reaches this many entries, keeping memory flat for streamed kits.
+IDENTITY_CACHE_SIZE = 4096
+
+
+class BOMLine:
+    """
+    One part on the pick list:
+      - component (first component seen with this identity)
+      - quantity (total across all kits)
+      - cost_cents (quantity * unit price)
+      - on_hand (units available in stock, or None if not checked)
+    """
+
+    def __init__(self, component, quantity: int = 0, cost_cents: int = 0):
+        self.component = component
+        self.quantity = quantity
+        self.cost_cents = cost_cents
+        self.on_hand = None
+
+    @property
+    def shortfall(self) -> int:
+        """Units missing from stock (0 if enough, or if stock wasn't checked)."""
+        if self.on_hand is None:
+            return 0
+        return max(0, self.quantity - self.on_hand)
+
+    def display_string(self) -> str:
+        # Example: "34 x 60mm Wire $3.20 = $108.80"
+        text = f"{self.quantity} x {self.component.display_string()} = ${self.cost_cents / 100:.2f}"
+        if self.shortfall:
+            text += f" (short {self.shortfall})"
+        return text
+
+
+class BillOfMaterials:
+    """
+    Combined pick list for an order:
+      - lines (dict of identity -> BOMLine, in first-seen order)
+      - kit_count
+      - total_quantity / total_cents across every line
+    """
+
+    def __init__(self):
+        self.lines = {}
+        self.kit_count = 0
+        self.total_quantity = 0
+        self.total_cents = 0
+
+    def shortfalls(self) -> list:
+        """Return the BOMLines that stock can't cover."""
+        return [line for line in self.lines.values() if line.shortfall]
+
+    def is_fulfillable(self) -> bool:
+        return not self.shortfalls()
+
+    def detail_display(self) -> str:
+        lines = [f"Bill of Materials: {self.kit_count} kits, {self.total_quantity} parts, "
+                 f"${self.total_cents / 100:.2f}"]
+        for line in self.lines.values():
+            lines.append(line.display_string())
+        return "\n".join(lines)
+
+
+def inventory_table(stock) -> dict:
+    """
+    Build an inventory table {identity: units on hand} from an iterable of
+    (quantity, component) tuples, e.g. the output of parse_single_component_from_csv.
+    """
+    table = {}
+    for qty, comp in stock:
+        key = comp.identity()
+        table[key] = table.get(key, 0) + qty
+    return table
+
+
+def build_bom(kits, inventory: dict = None) -> BillOfMaterials:
+    """
+    Merge the components of every kit into a BillOfMaterials.
+
+    kits: any iterable of CircuitKits (consumed once, never copied).
+    inventory: optional {identity: units on hand} (see inventory_table) or
+               an Inventory (its available_table(), so reserved units
+               don't count); when given, each line's on_hand is filled in
+               so shortfalls() can be reported.
+    """
+    bom = BillOfMaterials()
+    lines = bom.lines
+    cache = {}
+    kit_count = 0
+    total_quantity = 0
+    total_cents = 0
+
+    for kit in kits:
+        kit_count += 1
+        for qty, comp in kit.components:
+            cached = cache.get(id(comp))
+            if cached is None:
+                if len(cache) >= IDENTITY_CACHE_SIZE:
+                    cache.clear()
+                cached = cache[id(comp)] = (comp, comp.identity())
+            key = cached[1]
+
+            line = lines.get(key)
+            if line is None:
+                line = lines[key] = BOMLine(comp)
+            cost = qty * comp.price_cents
+            line.quantity += qty
+            line.cost_cents += cost
+            total_quantity += qty
+            total_cents += cost
+
+    bom.kit_count = kit_count
+    bom.total_quantity = total_quantity
+    bom.total_cents = total_cents
+
+    # Stock only needs checking once per distinct part, not per kit line
+    if inventory is not None:
+        if isinstance(inventory, Inventory):
+            inventory = inventory.available_table()
+        for key, line in lines.items():
+            line.on_hand = inventory.get(key, 0)
+    return bom
+
+
+# ----------------------------------
+# Example Usage / Testing
+# ----------------------------------
+
+if __name__ == "__main__":
+    import sys
+    from time import perf_counter
+
+    from A1_code import Battery, LightGlobe, Wire, Switch, LightCircuitKit
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    battery = Battery("AA", 1.5, 3.1)
+    globe = LightGlobe("warm", 6.5, 240, 3.5)
+    wire = Wire(60, 3.2)
+    switch = Switch("push", 4.5, 4.6)
+
+    def make_kits():
+        for _ in range(n):
+            kit = LightCircuitKit()
+            kit.add_component(2, battery)
+            kit.add_component(4, globe)
+            kit.add_component(14, wire)
+            kit.add_component(1, switch)
+            yield kit
+
+    stock = inventory_table([(2 * n, battery), (4 * n, globe), (10 * n, wire)])
+    start = perf_counter()
+    bom = build_bom(make_kits(), stock)
+    elapsed = perf_counter() - start
+    print(bom.detail_display())
+    print(f"\n{n} kits in {elapsed:.2f}s")
@@ -0,0 +1,253 @@
+"""
+Persistent cache of parsed component catalogs.
+
+A supplier catalog is a CSV file of "quantity,Type,fields..." lines, as read
+by parse_single_component_from_csv. Parsing it is the slow part of start-up,
+so CatalogCache stores the parsed list of (quantity, component) as a pickle
+in a cache directory next to the source file (.catalog_cache/ by default).
+
+Entries are keyed on the SHA-256 of the file's content, FORMAT_VERSION and
+a hash of A1_code's source, so an edited file or any change to the
+component classes simply misses: pickles written by older classes (say,
+before prices moved to price_cents) are never loaded. The directory is
+kept under max_bytes by evicting the least recently used entries (a hit
+refreshes an entry's mtime); abandoned temporary files are removed too.
+
+Only point the cache at directories you trust: entries are unpickled.
+"""
+
+import gc
+import hashlib
+import os
+import pickle
+import time
+
+import A1_code
+
+# Bump when the layout of a cache entry changes. Changes to the component
+# classes are picked up by CODE_FINGERPRINT without a bump.
+FORMAT_VERSION = 2
+
+CACHE_DIR_NAME = ".catalog_cache"
+CACHE_SUFFIX = ".pickle"
+TMP_SUFFIX = ".tmp"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# A temporary file this old was left by a writer that died mid-write
+STALE_TMP_SECONDS = 3600
+
+
+def _code_fingerprint() -> str:
+    """Short hash of A1_code's source, where the pickled classes are defined."""
+    with open(A1_code.__file__, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+CODE_FINGERPRINT = _code_fingerprint()
+
+
+def parse_catalog(lines) -> list:
+    """
+    Parse "quantity,Type,fields..." lines into a list of (quantity, component).
+    Blank lines and lines starting with "#" are skipped.
+    """
+    catalog = []
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        values = line.split(",")
+        try:
+            # Looked up on the module on every call so instrument() can time it
+            catalog.append(A1_code.parse_single_component_from_csv(int(values[0]), values[1:]))
+        except (ValueError, IndexError) as e:
+            raise ValueError(f"Line {line_number}: {e}") from None
+    return catalog
+
+
+class CacheStats:
+    """
+    Counters for one CatalogCache:
+      - hits / misses (loads served from / not found in the cache)
+      - writes (entries stored)
+      - evictions (entries deleted to stay under max_bytes, or unreadable)
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __repr__(self):
+        return (f"CacheStats(hits={self.hits}, misses={self.misses}, "
+                f"writes={self.writes}, evictions={self.evictions})")
+
+
+class CatalogCache:
+    """
+    Loads catalogs through an on-disk cache.
+      - cache_dir: where entries live (None: a .catalog_cache/ directory
+        next to each source file)
+      - max_bytes: size limit of each cache directory
+    """
+
+    def __init__(self, cache_dir: str = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+
+    def _dir_for(self, path: str) -> str:
+        if self.cache_dir is not None:
+            return self.cache_dir
+        return os.path.join(os.path.dirname(os.path.abspath(path)), CACHE_DIR_NAME)
+
+    def load(self, path: str) -> list:
+        """Return the parsed catalog in `path`, from the cache when possible."""
+        with open(path, "rb") as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        cache_dir = self._dir_for(path)
+        entry = os.path.join(cache_dir, f"{digest}.v{FORMAT_VERSION}-{CODE_FINGERPRINT}{CACHE_SUFFIX}")
+
+        catalog = self._read_entry(entry)
+        if catalog is not None:
+            self.stats.hits += 1
+            return catalog
+
+        self.stats.misses += 1
+        catalog = parse_catalog(data.decode("utf-8").splitlines())
+        self._write_entry(cache_dir, entry, catalog)
+        return catalog
+
+    def _read_entry(self, entry: str):
+        try:
+            with open(entry, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        # Unpickling allocates one object per component, none of them garbage;
+        # pausing the cyclic GC stops it rescanning them over and over
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            catalog = pickle.loads(data)
+        except Exception:
+            # Truncated or otherwise unreadable: drop it and re-parse
+            self._remove(entry)
+            return None
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        try:
+            os.utime(entry)  # mark as recently used
+        except OSError:
+            pass
+        return catalog
+
+    def _write_entry(self, cache_dir: str, entry: str, catalog: list):
+        tmp = f"{entry}.{os.getpid()}{TMP_SUFFIX}"
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            try:
+                with open(tmp, "wb") as f:
+                    pickle.dump(catalog, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, entry)  # atomic, so readers never see half an entry
+            except BaseException:
+                # e.g. the disk filled up mid-dump: don't leave the partial file
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+                raise
+        except OSError:
+            return  # a read-only or full disk just means no caching
+        self.stats.writes += 1
+        self.evict(cache_dir, keep=entry)
+
+    def evict(self, cache_dir: str, keep: str = None):
+        """
+        Delete least recently used entries until cache_dir fits in max_bytes.
+        Temporary files count towards the size; ones older than
+        STALE_TMP_SECONDS are deleted, newer ones may still be being written.
+        """
+        entries = []
+        total = 0
+        stale_before = time.time() - STALE_TMP_SECONDS
+        for name in os.listdir(cache_dir):
+            is_tmp = name.endswith(TMP_SUFFIX)
+            if not (is_tmp or name.endswith(CACHE_SUFFIX)):
+                continue
+            full = os.path.join(cache_dir, name)
+            try:
+                st = os.stat(full)
+            except OSError:
+                continue
+            if is_tmp and st.st_mtime < stale_before and self._remove(full):
+                continue
+            total += st.st_size
+            if not is_tmp:
+                entries.append((st.st_mtime, st.st_size, full))
+
+        for _, size, full in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if full == keep:
+                continue
+            if self._remove(full):
+                total -= size
+
+    def _remove(self, entry: str) -> bool:
+        try:
+            os.remove(entry)
+        except OSError:
+            return False
+        self.stats.evictions += 1
+        return True
+
+
+def load_catalog(path: str, cache: CatalogCache = None) -> list:
+    """Parse a catalog file, using `cache` if given."""
+    if cache is None:
+        with open(path, encoding="utf-8") as f:
+            return parse_catalog(f)
+    return cache.load(path)
+
+
+# ----------------------------------
+# Example Usage / Testing
+# ----------------------------------
+
+if __name__ == "__main__":
+    import sys
+    import tempfile
+    from time import perf_counter
+
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    samples = ["Wire,40,2.4", "Battery,AA,1.5,3.1", "Solar Panel,1.4,0.4,14.00", "Switch,push,4.5,4.6",
+               "Sensor,motion,5,3.9", "LED Light,red,3,150,2.2", "Light Globe,warm,6.5,240,3.5",
+               "Buzzer,240,90,4,120,5.6"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "catalog.csv")
+        with open(path, "w", encoding="utf-8") as f:
+            for i in range(rows):
+                f.write(f"{i % 50 + 1},{samples[i % len(samples)]}\n")
+
+        cache = CatalogCache()
+        start = perf_counter()
+        cold = cache.load(path)
+        cold_time = perf_counter() - start
+        start = perf_counter()
+        warm = cache.load(path)
+        warm_time = perf_counter() - start
+
+        assert len(cold) == len(warm) == rows
+        assert all(a == b for a, b in zip(cold, warm))
+        print(f"{rows} rows: parse {cold_time:.3f}s, cached load {warm_time:.3f}s "
+              f"({cold_time / warm_time:.1f}x faster)")
+        print(cache.stats)
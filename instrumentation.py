@@ -0,0 +1,317 @@
+"""
+Opt-in instrumentation for the circuit kit hot paths.
+
+Nothing here runs until instrument() is called: it wraps the factory, the kit
+mutation / validation / display methods and the component display / CSV
+methods with timing shims that report to every active registry, and
+uninstrument() puts the original functions back once no registry is left.
+While disabled the classes are untouched, so there is no overhead.
+
+Note: only lookups through the A1_code module see the wrapped factory
+(A1_code.parse_single_component_from_csv), which is how kit_cli and
+catalog_cache call it. Code that did
+`from A1_code import parse_single_component_from_csv` before instrument()
+keeps the original function.
+"""
+
+import bisect
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+
+import A1_code
+from A1_code import (
+    Wire, Battery, SolarPanel, Switch, Sensor, Light, LEDLight,
+    LightGlobe, Buzzer, CircuitKit, LightCircuitKit, SensorCircuitKit,
+)
+
+# ----------------------------------
+# Metrics Registry
+# ----------------------------------
+
+# Histogram bucket upper bounds, in seconds (Prometheus style, +Inf is implicit)
+DEFAULT_BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0)
+
+
+class Metric:
+    """
+    Call statistics for one (operation, type) pair:
+      - call count
+      - cumulative time (s)
+      - histogram of call durations
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.count = 0
+        self.total_time = 0.0
+        self.bucket_counts = [0] * (len(self.buckets) + 1)  # last one is +Inf
+
+    def observe(self, elapsed: float):
+        self.count += 1
+        self.total_time += elapsed
+        self.bucket_counts[bisect.bisect_left(self.buckets, elapsed)] += 1
+
+    def snapshot(self) -> dict:
+        """Return a plain dict copy of this metric."""
+        return {
+            "count": self.count,
+            "total_time": self.total_time,
+            "buckets": dict(zip(self.buckets + (float("inf"),), self.bucket_counts)),
+        }
+
+
+def _escape_label(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Registry:
+    """
+    Holds one Metric per (operation, type name), e.g. ("is_complete", "LightCircuitKit").
+    Safe to update from several threads.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def observe(self, operation: str, type_name: str, elapsed: float):
+        key = (operation, type_name)
+        with self._lock:
+            metric = self._metrics.get(key)
+            if metric is None:
+                metric = self._metrics[key] = Metric(self.buckets)
+            metric.observe(elapsed)
+
+    def reset(self):
+        with self._lock:
+            self._metrics.clear()
+
+    def snapshot(self) -> dict:
+        """
+        Return {operation: {type_name: {"count", "total_time", "buckets"}}}.
+        """
+        result = {}
+        with self._lock:
+            for (operation, type_name), metric in sorted(self._metrics.items()):
+                result.setdefault(operation, {})[type_name] = metric.snapshot()
+        return result
+
+    def to_prometheus(self, prefix: str = "circuitkit") -> str:
+        """
+        Render every metric in the Prometheus text exposition format, as a
+        `<prefix>_call_seconds` histogram labelled by operation and type.
+        """
+        name = f"{prefix}_call_seconds"
+        lines = [
+            f"# HELP {name} Time spent in instrumented circuit kit calls.",
+            f"# TYPE {name} histogram",
+        ]
+        for operation, by_type in self.snapshot().items():
+            for type_name, data in by_type.items():
+                labels = f'operation="{_escape_label(operation)}",type="{_escape_label(type_name)}"'
+                cumulative = 0
+                for bound, count in data["buckets"].items():
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+                lines.append(f"{name}_sum{{{labels}}} {data['total_time']!r}")
+                lines.append(f"{name}_count{{{labels}}} {data['count']}")
+        return "\n".join(lines) + "\n"
+
+
+# The registry used by instrument() unless another one is given
+registry = Registry()
+
+
+# ----------------------------------
+# Method Wrapping
+# ----------------------------------
+
+COMPONENT_CLASSES = (Wire, Battery, SolarPanel, Switch, Sensor, Light, LEDLight, LightGlobe, Buzzer)
+KIT_CLASSES = (CircuitKit, LightCircuitKit, SensorCircuitKit)
+
+COMPONENT_METHODS = ("display_string", "to_csv", "parse_csv")
+KIT_METHODS = (
+    "add_component", "remove_component",                  # mutation
+    "is_complete",                                        # validation
+    "total_price", "summary_display", "detail_display",   # display / pricing
+)
+
+_originals = []   # list of (owner, attribute name, original attribute)
+_install_lock = threading.Lock()
+
+# Registries currently receiving timings. The wrappers read this on every
+# call, so registries can be added and removed while the wrappers stay in
+# place; it is a tuple, replaced as a whole under _install_lock.
+_active = ()
+
+
+def _observe(operation: str, type_name: str, elapsed: float):
+    for target in _active:
+        target.observe(operation, type_name, elapsed)
+
+
+def _wrap_method(func, operation: str):
+    """Time an instance method, labelled by the runtime class of self."""
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        start = perf_counter()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            _observe(operation, type(self).__name__, perf_counter() - start)
+    return wrapper
+
+
+def _wrap_static(func, operation: str, type_name: str):
+    """Time a static method, labelled by the class that defines it."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _observe(operation, type_name, perf_counter() - start)
+    return wrapper
+
+
+def _wrap_factory(func):
+    """
+    Time the component factory, labelled by the class the row resolves to
+    (the same label as the parse_csv metrics), or "unknown". Labelling by
+    the raw CSV text would make one series per spelling or typo.
+    """
+    @wraps(func)
+    def wrapper(quantity, values):
+        start = perf_counter()
+        try:
+            return func(quantity, values)
+        finally:
+            component_class = A1_code.COMPONENT_TYPES.get(values[0].lower()) if values else None
+            type_name = component_class.__name__ if component_class is not None else "unknown"
+            _observe("parse_single_component_from_csv", type_name, perf_counter() - start)
+    return wrapper
+
+
+def _patch(owner, attr: str, replacement):
+    _originals.append((owner, attr, owner.__dict__[attr]))
+    setattr(owner, attr, replacement)
+
+
+def _install():
+    # Caller holds _install_lock
+    if _originals:
+        return
+    _patch(A1_code, "parse_single_component_from_csv",
+           _wrap_factory(A1_code.parse_single_component_from_csv))
+
+    for cls in COMPONENT_CLASSES:
+        for attr in COMPONENT_METHODS:
+            raw = cls.__dict__.get(attr)
+            if raw is None or getattr(raw, "__isabstractmethod__", False):
+                continue
+            if isinstance(raw, staticmethod):
+                _patch(cls, attr, staticmethod(_wrap_static(raw.__func__, attr, cls.__name__)))
+            else:
+                _patch(cls, attr, _wrap_method(raw, attr))
+
+    for cls in KIT_CLASSES:
+        for attr in KIT_METHODS:
+            raw = cls.__dict__.get(attr)
+            if raw is None or getattr(raw, "__isabstractmethod__", False):
+                continue
+            _patch(cls, attr, _wrap_method(raw, attr))
+
+
+def _restore():
+    # Caller holds _install_lock
+    while _originals:
+        owner, attr, original = _originals.pop()
+        setattr(owner, attr, original)
+
+
+def is_instrumented() -> bool:
+    return bool(_originals)
+
+
+def instrument(target: Registry = None):
+    """
+    Start sending timings to `target` (the module registry by default),
+    installing timing wrappers on the factory, component classes and kit
+    classes if they aren't in place yet. Only methods defined directly on a
+    class are wrapped, so an overridden method is timed once per call.
+
+    Several registries can be active at once; each one receives every timing.
+    Adding a registry that is already active is a no-op.
+    """
+    global _active
+    target = registry if target is None else target
+    with _install_lock:
+        if target not in _active:
+            _active = _active + (target,)
+        _install()
+
+
+def uninstrument(target: Registry = None):
+    """
+    Stop sending timings to `target`, or to every registry if it is None.
+    Once no registry is active, every replaced attribute is restored.
+    """
+    global _active
+    with _install_lock:
+        if target is None:
+            _active = ()
+        else:
+            _active = tuple(r for r in _active if r is not target)
+        if not _active:
+            _restore()
+
+
+@contextmanager
+def profile(target: Registry = None):
+    """
+    Send timings to `target` for the duration of a `with` block and yield it.
+    Registries that were already active keep receiving timings too, and stay
+    active afterwards.
+
+    Example:
+        with profile(Registry()) as stats:
+            kit.summary_display()
+        print(stats.to_prometheus())
+    """
+    target = registry if target is None else target
+    already_active = target in _active
+    instrument(target)
+    start = perf_counter()
+    try:
+        yield target
+    finally:
+        target.observe("profile_block", "block", perf_counter() - start)
+        if not already_active:
+            uninstrument(target)
+
+
+# ----------------------------------
+# Example Usage / Testing
+# ----------------------------------
+
+if __name__ == "__main__":
+    with profile(Registry()) as stats:
+        kit = LightCircuitKit()
+        for row in ("2,Battery,AA,1.5,3.1", "4,Light Globe,warm,6.5,240,3.5",
+                    "14,Wire,60,3.2", "1,Switch,push,4.5,4.6"):
+            parts = row.split(",")
+            kit.add_component(*A1_code.parse_single_component_from_csv(int(parts[0]), parts[1:]))
+        kit.detail_display()
+        kit.is_complete()
+
+    for operation, by_type in stats.snapshot().items():
+        for type_name, data in by_type.items():
+            print(f"{operation:<32} {type_name:<16} {data['count']:>4} calls "
+                  f"{data['total_time'] * 1e6:8.1f}us")
+    print()
+    print(stats.to_prometheus())
@@ -0,0 +1,173 @@
+"""
+Stock tracking with reserve / commit / release.
+
+Stock is keyed on Component.identity(). A reservation holds units aside
+until it is committed (the units leave stock for good) or released (the
+units go back on the shelf), so a kit builder can reserve a whole kit up
+front and never oversell.
+
+Inventory() is safe to share between threads. For several processes, build
+it with Inventory.shared(manager) so the counters and the lock live in a
+multiprocessing Manager and can be passed to worker processes.
+"""
+
+import itertools
+import threading
+
+
+class OutOfStockError(ValueError):
+    """Raised when a reservation asks for more units than are available."""
+
+    def __init__(self, identity, requested: int, available: int):
+        super().__init__(f"Not enough stock for {identity[0]}: requested {requested}, available {available}")
+        self.identity = identity
+        self.requested = requested
+        self.available = available
+
+
+class Reservation:
+    """
+    Units held aside by Inventory.reserve / reserve_kit:
+      - reservation_id
+      - items (dict of identity -> quantity)
+    """
+
+    def __init__(self, reservation_id: int, items: dict):
+        self.reservation_id = reservation_id
+        self.items = items
+
+    def __repr__(self):
+        return f"Reservation({self.reservation_id}, {len(self.items)} parts)"
+
+
+class Inventory:
+    """
+    Stock counters per part:
+      - on_hand (units physically in stock, including reserved ones)
+      - reserved (units held by open reservations)
+    available = on_hand - reserved
+    """
+
+    def __init__(self, on_hand=None, reserved=None, open_reservations=None, lock=None, counter=None):
+        # The containers are injectable so shared() can swap in Manager proxies
+        self._on_hand = {} if on_hand is None else on_hand
+        self._reserved = {} if reserved is None else reserved
+        self._open = {} if open_reservations is None else open_reservations
+        self._lock = threading.Lock() if lock is None else lock
+        self._counter = counter
+
+        self._ids = itertools.count(1)
+
+    @classmethod
+    def shared(cls, manager):
+        """
+        Build an Inventory whose state lives in a multiprocessing Manager, e.g.
+
+            with multiprocessing.Manager() as manager:
+                inventory = Inventory.shared(manager)
+                pool.map(build_kit, [(inventory, order) for order in orders])
+        """
+        return cls(manager.dict(), manager.dict(), manager.dict(), manager.Lock(), manager.Value("q", 0))
+
+    def __getstate__(self):
+        if self._counter is None:
+            raise TypeError("A local Inventory can't be sent to another process; use Inventory.shared()")
+        state = self.__dict__.copy()
+        del state["_ids"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._ids = itertools.count(1)
+
+    def _next_id(self) -> int:
+        # Caller holds self._lock
+        if self._counter is None:
+            return next(self._ids)
+        self._counter.value += 1
+        return self._counter.value
+
+    # Stock levels
+
+    def add_stock(self, quantity: int, component):
+        """Put `quantity` more units of a component on the shelf."""
+        if quantity < 0:
+            raise ValueError(f"quantity must be >= 0, got {quantity}")
+        key = component.identity()
+        with self._lock:
+            self._on_hand[key] = self._on_hand.get(key, 0) + quantity
+
+    def on_hand(self, component) -> int:
+        return self._on_hand.get(component.identity(), 0)
+
+    def reserved(self, component) -> int:
+        return self._reserved.get(component.identity(), 0)
+
+    def available(self, component) -> int:
+        key = component.identity()
+        with self._lock:
+            return self._on_hand.get(key, 0) - self._reserved.get(key, 0)
+
+    def available_table(self) -> dict:
+        """
+        Return {identity: available units} for every part, taken as one
+        consistent snapshot. This is the stock table build_bom() checks.
+        """
+        with self._lock:
+            reserved = dict(self._reserved.items())
+            return {key: qty - reserved.get(key, 0) for key, qty in self._on_hand.items()}
+
+    # Reservations
+
+    def reserve(self, quantity: int, component) -> Reservation:
+        """Hold `quantity` units of one component. Raises OutOfStockError."""
+        return self.reserve_many([(quantity, component)])
+
+    def reserve_kit(self, kit, kits: int = 1) -> Reservation:
+        """Hold every component needed to build `kits` copies of a kit, all or nothing."""
+        return self.reserve_many((qty * kits, comp) for qty, comp in kit.components)
+
+    def reserve_many(self, lines) -> Reservation:
+        """
+        Hold every (quantity, component) in lines as one reservation.
+        Either all lines are reserved or none are (OutOfStockError is raised).
+        """
+        items = {}
+        for qty, comp in lines:
+            if qty < 0:
+                raise ValueError(f"quantity must be >= 0, got {qty}")
+            key = comp.identity()
+            items[key] = items.get(key, 0) + qty
+
+        with self._lock:
+            for key, qty in items.items():
+                available = self._on_hand.get(key, 0) - self._reserved.get(key, 0)
+                if qty > available:
+                    raise OutOfStockError(key, qty, available)
+            for key, qty in items.items():
+                self._reserved[key] = self._reserved.get(key, 0) + qty
+            reservation = Reservation(self._next_id(), items)
+            self._open[reservation.reservation_id] = items
+        return reservation
+
+    def commit(self, reservation: Reservation):
+        """The reserved units have been used: remove them from stock."""
+        with self._lock:
+            items = self._pop_open(reservation)
+            for key, qty in items.items():
+                self._reserved[key] -= qty
+                self._on_hand[key] -= qty
+
+    def release(self, reservation: Reservation):
+        """The reserved units weren't needed: make them available again."""
+        with self._lock:
+            items = self._pop_open(reservation)
+            for key, qty in items.items():
+                self._reserved[key] -= qty
+
+    def _pop_open(self, reservation: Reservation) -> dict:
+        # Caller holds self._lock
+        items = self._open.pop(reservation.reservation_id, None)
+        if items is None:
+            raise ValueError(f"Reservation {reservation.reservation_id} is not open")
+        return items
@@ -0,0 +1,325 @@
+"""
+Command-line tool for kit CSV files.
+
+Usage:
+    python kit_cli.py validate  [OPTIONS] [FILE ...]
+    python kit_cli.py price     [OPTIONS] [FILE ...]
+    python kit_cli.py summarize [OPTIONS] [FILE ...]
+    python kit_cli.py report    [OPTIONS] [FILE ...]
+
+Options:
+    --format csv|jsonl   output format (default csv)
+    --header             write a header row (csv only)
+    -j, --jobs N         check kits in N worker processes (default 1)
+
+With no FILE, or FILE "-", kits are read from stdin. Each line of a kit file
+is one component of one kit:
+
+    kit_id,kit_type,quantity,Type,fields...
+    k1,light,2,Battery,AA,1.5,3.1
+    k1,light,4,Light Globe,warm,6.5,240,3.5
+
+Consecutive lines with the same kit_id form a kit; kit_type is "light" or
+"sensor" (see KIT_TYPES). Blank lines and lines starting with "#" are skipped.
+Each file is read on its own: a kit never spans two files, and errors give
+the file name and its own line number.
+
+One record is written per kit, in input order: validate gives kit_id and
+status ("complete" / "incomplete"), price gives kit_id and total_price,
+summarize gives kit_id and summary, and report gives all of them plus
+kit_type. Every record ends with an error field, empty unless the kit has a
+bad line (malformed row, unknown kit or component type, or a kit_type that
+differs from the kit's first line): such a kit gets status "invalid", the
+error message and empty values, and checking carries on with the next kit.
+Every command exits with status 1 if any kit is invalid, and validate and
+report also if any kit is incomplete.
+
+Input is streamed, so files of any size can be checked in constant memory.
+With --jobs, batches of whole kits are sent to worker processes and only a
+bounded number of batches is in flight at once.
+
+This is meant for short-lived workers, so it only imports A1_code and sys up
+front (json and multiprocessing are imported when used): argument
+parsing is done by hand rather than with argparse, which alone would roughly
+double the interpreter's start-up time. bench_startup.py tracks the
+cold-start time against STARTUP_BUDGET_MS.
+"""
+
+import sys
+
+import A1_code
+from A1_code import KIT_TYPES
+
+COMMAND_FIELDS = {
+    "validate": ("kit_id", "status", "error"),
+    "price": ("kit_id", "total_price", "error"),
+    "summarize": ("kit_id", "summary", "error"),
+    "report": ("kit_id", "kit_type", "status", "total_price", "summary", "error"),
+}
+FORMATS = ("csv", "jsonl")
+
+KITS_PER_BATCH = 1000      # kits sent to a worker process at a time
+BATCHES_PER_JOB = 4        # batches in flight per worker process
+
+
+# ----------------------------------
+# Reading Kit Files
+# ----------------------------------
+
+def read_kits(lines, first_line_number: int = 1, source: str = None):
+    """
+    Yield (kit_id, kit, error) for every kit in an iterable of kit CSV
+    lines, one kit at a time. error is None for a kit that was read; for a
+    kit with a bad line it is a message like "source, line N: ...", kit is
+    None, and the rest of that kit's lines are skipped.
+    """
+    kit_id = None
+    kit_class = None
+    kit = None
+    error = None
+    where = f"{source}, line" if source is not None else "Line"
+    for line_number, line in enumerate(lines, first_line_number):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        fields = line.split(",")
+        row_kit_id = fields[0]
+        row_kit_class = KIT_TYPES.get(fields[1].lower()) if len(fields) > 1 else None
+
+        if row_kit_id != kit_id:
+            if kit_id is not None:
+                yield kit_id, kit, error
+            kit_id = row_kit_id
+            kit_class = row_kit_class
+            kit = kit_class() if kit_class is not None else None
+            error = None
+            if kit is None and len(fields) >= 4:
+                error = f"{where} {line_number}: unknown kit type {fields[1]!r}"
+        if error is not None:
+            continue  # the kit is already invalid
+
+        if len(fields) < 4:
+            error = f"{where} {line_number}: expected kit_id,kit_type,quantity,component... got {line!r}"
+        elif row_kit_class is not kit_class:
+            error = (f"{where} {line_number}: kit type {fields[1]!r} doesn't match "
+                     f"the {kit.kit_name} started earlier in kit {kit_id!r}")
+        else:
+            try:
+                quantity = int(fields[2])
+            except ValueError:
+                error = f"{where} {line_number}: quantity must be a whole number, got {fields[2]!r}"
+            else:
+                try:
+                    # Looked up on the module so instrument() can time it
+                    kit.add_component(*A1_code.parse_single_component_from_csv(quantity, fields[3:]))
+                except (ValueError, IndexError) as e:
+                    error = f"{where} {line_number}: {e}"
+        if error is not None:
+            kit = None
+
+    if kit_id is not None:
+        yield kit_id, kit, error
+
+
+def open_inputs(paths):
+    """
+    Yield (source, lines) for every path in turn ("-" or no paths means
+    stdin). Each file is closed once the next one is requested.
+    """
+    for path in paths or ["-"]:
+        if path == "-":
+            yield "<stdin>", sys.stdin
+        else:
+            with open(path, encoding="utf-8") as f:
+                yield path, f
+
+
+def batch_kit_lines(lines, kits_per_batch: int = KITS_PER_BATCH):
+    """
+    Group kit CSV lines into (first_line_number, lines) batches holding up
+    to kits_per_batch whole kits each, so a batch can be parsed on its own.
+    """
+    batch = []
+    first_line_number = 1
+    kits = 0
+    kit_id = None
+    for line_number, line in enumerate(lines, 1):
+        stripped = line.strip()
+        row_kit_id = stripped.split(",", 1)[0]
+        if row_kit_id != kit_id and stripped and not stripped.startswith("#"):
+            kit_id = row_kit_id
+            if kits == kits_per_batch:
+                yield first_line_number, batch
+                batch = []
+                first_line_number = line_number
+                kits = 0
+            kits += 1
+        batch.append(line)
+    if batch:
+        yield first_line_number, batch
+
+
+# ----------------------------------
+# Checking Kits
+# ----------------------------------
+
+def kit_record(kit_id: str, kit, fields, error: str = None) -> dict:
+    """Compute only the requested fields for one kit (read_kits output)."""
+    if error is not None:
+        record = dict.fromkeys(fields, "")
+        record["kit_id"] = kit_id
+        if "status" in fields:
+            record["status"] = "invalid"
+        record["error"] = error
+        return record
+    record = {"kit_id": kit_id}
+    if "kit_type" in fields:
+        record["kit_type"] = kit.kit_name
+    if "status" in fields:
+        record["status"] = "complete" if kit.is_complete() else "incomplete"
+    if "total_price" in fields:
+        record["total_price"] = f"{kit.total_price_cents() / 100:.2f}"
+    if "summary" in fields:
+        record["summary"] = kit.summary_display()
+    record["error"] = ""
+    return record
+
+
+def check_batch(args) -> list:
+    """Worker entry point: parse one batch of lines and return its records."""
+    fields, source, first_line_number, lines = args
+    return [kit_record(kit_id, kit, fields, error)
+            for kit_id, kit, error in read_kits(lines, first_line_number, source)]
+
+
+def iter_records(inputs, fields, jobs: int = 1):
+    """
+    Yield one record per kit, in input order, using `jobs` processes.
+    inputs is an iterable of (source, lines), as from open_inputs().
+    """
+    if jobs <= 1:
+        for source, lines in inputs:
+            for kit_id, kit, error in read_kits(lines, source=source):
+                yield kit_record(kit_id, kit, fields, error)
+        return
+
+    from collections import deque
+    from multiprocessing import Pool
+
+    with Pool(jobs) as pool:
+        pending = deque()
+        for source, lines in inputs:
+            # Batches never span files, so kits are split at file boundaries
+            for first_line_number, batch in batch_kit_lines(lines):
+                pending.append(pool.apply_async(check_batch, ((fields, source, first_line_number, batch),)))
+                # Bound the work in flight so huge inputs aren't read ahead into memory
+                if len(pending) >= jobs * BATCHES_PER_JOB:
+                    yield from pending.popleft().get()
+        while pending:
+            yield from pending.popleft().get()
+
+
+# ----------------------------------
+# Output
+# ----------------------------------
+
+def csv_field(value) -> str:
+    """
+    Quote a CSV field the way csv.writer does by default (QUOTE_MINIMAL).
+    Records end in "\\n", not csv.writer's default "\\r\\n".
+    """
+    text = str(value)
+    if any(c in text for c in ',"\r\n'):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def make_writer(output_format: str, fields, out, header: bool = False):
+    """Return a function writing one record to `out` in the given format."""
+    if output_format == "jsonl":
+        import json
+        dumps = json.dumps
+        return lambda record: out.write(dumps(record) + "\n")
+
+    # Written by hand: importing the csv module pulls in re, which costs more
+    # than the rest of the tool's start-up put together
+    if header:
+        out.write(",".join(fields) + "\n")
+    return lambda record: out.write(",".join([csv_field(record[field]) for field in fields]) + "\n")
+
+
+# ----------------------------------
+# Command Line
+# ----------------------------------
+
+def parse_args(argv) -> dict:
+    """Parse the command line by hand. Raises ValueError on bad usage."""
+    if not argv or argv[0] not in COMMAND_FIELDS:
+        raise ValueError("expected a command: " + ", ".join(COMMAND_FIELDS))
+    options = {"command": argv[0], "format": "csv", "header": False, "jobs": 1, "paths": []}
+    args = iter(argv[1:])
+    for arg in args:
+        name, has_value, value = arg.partition("=")
+        if arg.startswith("-j") and len(arg) > 2 and not has_value:
+            name, has_value, value = "-j", True, arg[2:]  # -j4
+        if arg == "--":
+            options["paths"].extend(args)
+        elif arg == "--header":
+            options["header"] = True
+        elif name in ("--format", "--jobs", "-j"):
+            if not has_value:
+                value = next(args, None)
+                if value is None:
+                    raise ValueError(f"{name} needs a value")
+            if name == "--format":
+                if value not in FORMATS:
+                    raise ValueError(f"unknown format {value!r} (choose from {', '.join(FORMATS)})")
+                options["format"] = value
+            else:
+                if not value.isdigit() or int(value) < 1:
+                    raise ValueError(f"{name} needs a positive integer, got {value!r}")
+                options["jobs"] = int(value)
+        elif arg.startswith("-") and arg != "-":
+            raise ValueError(f"unknown option {arg}")
+        else:
+            options["paths"].append(arg)
+    return options
+
+
+def run(command: str, paths, out=sys.stdout, output_format: str = "csv",
+        header: bool = False, jobs: int = 1) -> int:
+    """Run one command over the given files and return the exit status."""
+    fields = COMMAND_FIELDS[command]
+    write = make_writer(output_format, fields, out, header)
+    status = 0
+    for record in iter_records(open_inputs(paths), fields, jobs):
+        if record["error"] or record.get("status") == "incomplete":
+            status = 1
+        write(record)
+    return status
+
+
+def _usage() -> str:
+    return "\n\n".join(__doc__.split("\n\n")[1:3]) + "\n"
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in ("-h", "--help"):
+        sys.stdout.write(_usage())
+        return 0
+    try:
+        options = parse_args(argv)
+    except ValueError as e:
+        sys.stderr.write(f"kit_cli: {e}\n\n{_usage()}")
+        return 2
+    try:
+        return run(options["command"], options["paths"], sys.stdout,
+                   options["format"], options["header"], options["jobs"])
+    except (OSError, ValueError) as e:
+        sys.stderr.write(f"kit_cli: {e}\n")
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
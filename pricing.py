@@ -0,0 +1,223 @@
+"""
+Exact integer-cents pricing for kits and orders.
+
+Component prices are stored as integer cents (Component.price_cents), so
+every total here is an exact int. Volume discounts are expressed in basis
+points (1/100 of a percent) and rounded half up to the cent once per line
+(total_cents() rounds once per tier instead, see there).
+
+For very large orders, line_totals_cents() / total_cents() price whole
+columns of quantities and unit prices at once. numpy is used when it is
+installed; otherwise a stdlib path of chained map() calls is used, which
+never calls a Python function per line but still steps through every line
+in the interpreter's C loop. Without numpy the column path only beats a
+per-tuple generator sum when the columns already exist: building them from
+kits with kit_columns() costs more than summing the kit lines directly,
+and discounts still cost several passes over the columns (see
+bench_pricing.py, which also checks that both paths agree).
+"""
+
+import operator
+from array import array
+from bisect import bisect_right
+from itertools import compress, repeat
+
+from A1_code import to_cents
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+BASIS_POINTS = 10000  # 100%
+
+
+# ----------------------------------
+# Discount Tiers
+# ----------------------------------
+
+class DiscountTier:
+    """
+    A volume discount tier:
+      - min_quantity (line quantity at which the tier starts to apply)
+      - basis_points (discount, e.g. 500 = 5% off)
+    """
+
+    def __init__(self, min_quantity: int, basis_points: int):
+        if min_quantity < 0:
+            raise ValueError(f"min_quantity must be >= 0, got {min_quantity}")
+        if not 0 <= basis_points <= BASIS_POINTS:
+            raise ValueError(f"basis_points must be between 0 and {BASIS_POINTS}, got {basis_points}")
+        self.min_quantity = int(min_quantity)
+        self.basis_points = int(basis_points)
+
+    def __eq__(self, other):
+        if not isinstance(other, DiscountTier):
+            return False
+        return (self.min_quantity == other.min_quantity and
+                self.basis_points == other.basis_points)
+
+    def __repr__(self):
+        return f"DiscountTier({self.min_quantity}, {self.basis_points})"
+
+
+class PriceSchedule:
+    """
+    A set of DiscountTiers. The tier with the highest min_quantity not above
+    a line's quantity applies; lines below every tier pay full price.
+
+    Example: PriceSchedule([DiscountTier(100, 500), DiscountTier(1000, 1000)])
+    gives 5% off lines of 100-999 units and 10% off lines of 1000+.
+    """
+
+    def __init__(self, tiers=()):
+        self.tiers = sorted(tiers, key=lambda t: t.min_quantity)
+        self._thresholds = [t.min_quantity for t in self.tiers]
+        # _rates[i] is the multiplier (in basis points) for bisect index i
+        self._rates = [BASIS_POINTS] + [BASIS_POINTS - t.basis_points for t in self.tiers]
+
+    def rate_for(self, quantity: int) -> int:
+        """Return the share of the gross price paid, in basis points."""
+        return self._rates[bisect_right(self._thresholds, quantity)]
+
+    def line_total_cents(self, unit_cents: int, quantity: int) -> int:
+        """Price of `quantity` units at `unit_cents` each, after any tier discount."""
+        return _apply_rate(unit_cents * quantity, self.rate_for(quantity))
+
+
+def _apply_rate(gross_cents: int, rate: int) -> int:
+    """gross * rate / 10000, rounded half up to the cent."""
+    if rate == BASIS_POINTS:
+        return gross_cents
+    return (gross_cents * rate + BASIS_POINTS // 2) // BASIS_POINTS
+
+
+# ----------------------------------
+# Kit and Order Totals
+# ----------------------------------
+
+def kit_total_cents(kit, schedule: PriceSchedule = None) -> int:
+    """Exact price of one kit in cents, optionally with volume discounts per line."""
+    if schedule is None:
+        return kit.total_price_cents()
+    return sum(schedule.line_total_cents(comp.price_cents, qty) for qty, comp in kit.components)
+
+
+def order_total_cents(kits, schedule: PriceSchedule = None) -> int:
+    """Exact price of an iterable of kits in cents."""
+    return sum(kit_total_cents(kit, schedule) for kit in kits)
+
+
+def format_cents(cents: int) -> str:
+    """Format integer cents as a dollar string, e.g. 6960 -> "$69.60"."""
+    sign = "-" if cents < 0 else ""
+    dollars, rem = divmod(abs(cents), 100)
+    return f"{sign}${dollars}.{rem:02d}"
+
+
+# ----------------------------------
+# Vectorized (Column) Pricing
+# ----------------------------------
+
+def kit_columns(kits):
+    """
+    Flatten the lines of many kits into two int64 columns:
+    (quantities, unit_cents). Uses numpy arrays when available.
+    """
+    quantities = array("q")
+    unit_cents = array("q")
+    for kit in kits:
+        for qty, comp in kit.components:
+            quantities.append(qty)
+            unit_cents.append(comp.price_cents)
+    if np is not None:
+        return np.frombuffer(quantities, dtype=np.int64), np.frombuffer(unit_cents, dtype=np.int64)
+    return quantities, unit_cents
+
+
+def line_totals_cents(quantities, unit_cents, schedule: PriceSchedule = None):
+    """
+    Price every line of two equal-length columns at once and return a column
+    of line totals in cents (numpy int64 array, or array('q') without numpy).
+    Each discounted line is rounded half up to the cent, as line_total_cents().
+    """
+    _check_columns(quantities, unit_cents)
+    if np is not None:
+        return _line_totals_numpy(quantities, unit_cents, schedule)
+    return _line_totals_stdlib(quantities, unit_cents, schedule)
+
+
+def total_cents(quantities, unit_cents, schedule: PriceSchedule = None) -> int:
+    """
+    Exact total of two columns of quantities and unit prices, in cents.
+
+    With a schedule, the gross of all lines in the same tier is summed and
+    the tier's discount applied once, rounded half up to the cent. That is
+    one rounding per tier rather than per line, so the result can differ from
+    order_total_cents() (and from summing line_totals_cents()) by less than
+    a cent per discounted line.
+    """
+    _check_columns(quantities, unit_cents)
+    if np is not None:
+        return _total_cents_numpy(quantities, unit_cents, schedule)
+    return _total_cents_stdlib(quantities, unit_cents, schedule)
+
+
+def _check_columns(quantities, unit_cents):
+    if len(quantities) != len(unit_cents):
+        raise ValueError(f"column lengths differ: {len(quantities)} != {len(unit_cents)}")
+
+
+def _has_discounts(schedule) -> bool:
+    return schedule is not None and bool(schedule.tiers)
+
+
+# Both implementations are kept callable so bench_pricing.py can check that
+# they agree. The stdlib ones only chain C-level map() calls: no Python
+# function is called per line.
+
+def _line_totals_numpy(quantities, unit_cents, schedule):
+    qty = np.asarray(quantities, dtype=np.int64)
+    gross = qty * np.asarray(unit_cents, dtype=np.int64)
+    if not _has_discounts(schedule):
+        return gross
+    rates = np.asarray(schedule._rates, dtype=np.int64)[
+        np.searchsorted(schedule._thresholds, qty, side="right")]
+    return (gross * rates + BASIS_POINTS // 2) // BASIS_POINTS
+
+
+def _line_totals_stdlib(quantities, unit_cents, schedule):
+    gross = map(operator.mul, quantities, unit_cents)
+    if not _has_discounts(schedule):
+        return array("q", gross)
+    rates = map(schedule._rates.__getitem__, map(bisect_right, repeat(schedule._thresholds), quantities))
+    scaled = map(operator.add, map(operator.mul, gross, rates), repeat(BASIS_POINTS // 2))
+    return array("q", map(operator.floordiv, scaled, repeat(BASIS_POINTS)))
+
+
+def _total_cents_numpy(quantities, unit_cents, schedule) -> int:
+    qty = np.asarray(quantities, dtype=np.int64)
+    gross = qty * np.asarray(unit_cents, dtype=np.int64)
+    if not _has_discounts(schedule):
+        return int(gross.sum())
+    tiers = np.searchsorted(schedule._thresholds, qty, side="right")
+    return sum(_apply_rate(int(gross[tiers == tier].sum()), rate)
+               for tier, rate in enumerate(schedule._rates))
+
+
+def _total_cents_stdlib(quantities, unit_cents, schedule) -> int:
+    if not _has_discounts(schedule):
+        return sum(map(operator.mul, quantities, unit_cents))
+    gross = array("q", map(operator.mul, quantities, unit_cents))
+    # at_least[i]: gross of the lines in tier i or above (tier 0 = no discount)
+    at_least = [sum(gross)]
+    for threshold in schedule._thresholds:
+        at_least.append(sum(compress(gross, map(threshold.__le__, quantities))))
+    at_least.append(0)
+    return sum(_apply_rate(at_least[tier] - at_least[tier + 1], rate)
+               for tier, rate in enumerate(schedule._rates))
+
+
+def price_column_to_cents(prices):
+    """Convert a column of dollar prices (floats or strings) to an int64 cents column."""
+    return array("q", map(to_cents, prices))
@@ -0,0 +1,166 @@
+"""
+Enumerate every valid SensorCircuitKit that can be built from a catalog.
+
+A Sensor Circuit needs (see SensorCircuitKit.is_complete):
+  - one kind of power supply (batteries or solar panels, not both)
+  - exactly one sensor
+  - optionally an output: a single buzzer or N matching LED lights (not both)
+  - optionally a switch
+  - more wires than all other components combined
+
+Instead of building every combination and testing it, the enumerator
+builds candidates slot by slot (power, sensor, output, switch, wires) from
+parts that already satisfy these rules, so only valid kits are produced.
+Each slot's options are sorted by price, and a branch is cut as soon as its
+running cost plus the cheapest possible rest of the kit is above the price
+band. Results are generated lazily.
+
+The catalog is deduplicated by Component.identity() first, so every kit
+produced is distinct.
+"""
+
+from A1_code import (
+    Battery, SolarPanel, Sensor, Buzzer, LEDLight, Switch, Wire, SensorCircuitKit,
+)
+
+
+def _unique_parts(catalog) -> list:
+    """Components from a catalog of components or (quantity, component) tuples, deduplicated."""
+    seen = {}
+    for item in catalog:
+        comp = item[1] if isinstance(item, tuple) else item
+        seen.setdefault(comp.identity(), comp)
+    return list(seen.values())
+
+
+def _cost(option) -> int:
+    """Cost in cents of one (quantity, component) option; (0, None) is free."""
+    return option[0] * option[1].price_cents if option[1] is not None else 0
+
+
+def _options(parts, quantities) -> list:
+    """Every (quantity, component) for the given parts and quantities, cheapest first."""
+    options = [(qty, comp) for comp in parts for qty in quantities]
+    options.sort(key=_cost)
+    return options
+
+
+def sensor_kit_lines(catalog, min_cents: int = 0, max_cents: int = None,
+                     power_quantities=(1,), max_lights: int = 4, extra_wires: int = 0,
+                     require_output: bool = False):
+    """
+    Yield (total_cents, lines) for every valid Sensor Circuit in the price
+    band [min_cents, max_cents], where lines is a tuple of
+    (quantity, component). No kit objects are built.
+
+    power_quantities: how many batteries / solar panels a kit may use
+    max_lights: largest number of matching LED lights to try
+    extra_wires: also try up to this many wires above the minimum
+    require_output: skip kits with neither a buzzer nor lights, which
+                    is_complete() accepts
+    """
+    parts = _unique_parts(catalog)
+    by_type = {cls: [p for p in parts if isinstance(p, cls)]
+               for cls in (Battery, SolarPanel, Sensor, Buzzer, LEDLight, Switch, Wire)}
+
+    powers = _options(by_type[Battery] + by_type[SolarPanel], power_quantities)
+    sensors = _options(by_type[Sensor], (1,))
+    outputs = sorted(_options(by_type[Buzzer], (1,)) +
+                     _options(by_type[LEDLight], range(1, max_lights + 1)), key=_cost)
+    if not require_output:
+        outputs.insert(0, (0, None))  # no buzzer or lights
+    switches = [None] + _options(by_type[Switch], (1,))
+    wires = sorted(by_type[Wire], key=lambda w: w.price_cents)
+    if not (powers and sensors and outputs and wires):
+        return
+
+    if max_cents is None:
+        max_cents = float("inf")
+    cheapest_wire = wires[0].price_cents
+    cheapest_sensor = sensors[0][1].price_cents
+    cheapest_output = _cost(outputs[0])
+    min_power_qty = min(power_quantities)
+    # Fewest wires on top of the power supply: more than sensor + output + 1
+    min_wires = 2 + min(qty for qty, _ in outputs)
+
+    # Options are sorted by cost, so once even the fewest-units bound is over
+    # budget every later option is too (break); a bound that depends on this
+    # option's own unit count only rules out this option (continue).
+    for power in powers:
+        power_cost = power[0] * power[1].price_cents
+        rest = cheapest_sensor + cheapest_output
+        if power_cost + rest + cheapest_wire * (min_power_qty + min_wires) > max_cents:
+            break
+        if power_cost + rest + cheapest_wire * (power[0] + min_wires) > max_cents:
+            continue
+        for sensor in sensors:
+            cost = power_cost + sensor[1].price_cents
+            if cost + cheapest_output + cheapest_wire * (power[0] + min_wires) > max_cents:
+                break
+            for output in outputs:
+                cost_out = cost + _cost(output)
+                count = power[0] + 1 + output[0]
+                if cost_out + cheapest_wire * (power[0] + min_wires) > max_cents:
+                    break
+                if cost_out + cheapest_wire * (count + 1) > max_cents:
+                    continue
+                for switch in switches:
+                    lines = (power, sensor, output) if output[1] is not None else (power, sensor)
+                    total = cost_out
+                    others = count
+                    if switch is not None:
+                        lines += (switch,)
+                        total += switch[1].price_cents
+                        others += 1
+                    for wire in wires:
+                        if total + (others + 1) * wire.price_cents > max_cents:
+                            break
+                        for wire_qty in range(others + 1, others + 2 + extra_wires):
+                            kit_total = total + wire_qty * wire.price_cents
+                            if kit_total > max_cents:
+                                break
+                            if kit_total >= min_cents:
+                                yield kit_total, lines + ((wire_qty, wire),)
+
+
+def enumerate_sensor_kits(catalog, min_cents: int = 0, max_cents: int = None, **options):
+    """
+    Yield a SensorCircuitKit for every valid combination in the price band.
+    Takes the same options as sensor_kit_lines().
+    """
+    for _, lines in sensor_kit_lines(catalog, min_cents, max_cents, **options):
+        kit = SensorCircuitKit()
+        for qty, comp in lines:
+            kit.add_component(qty, comp)
+        yield kit
+
+
+# ----------------------------------
+# Example Usage / Testing
+# ----------------------------------
+
+if __name__ == "__main__":
+    import sys
+    from itertools import islice
+    from time import perf_counter
+
+    max_cents = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    catalog = (
+        [Battery(size, v, p) for size, v, p in (("AA", 1.5, 3.1), ("AAA", 1.5, 2.6), ("C", 1.5, 4.2), ("D", 1.5, 5.0))]
+        + [SolarPanel(v, c, p) for v, c, p in ((1.4, 0.4, 14.0), (3.0, 1.2, 22.5))]
+        + [Sensor(t, 5, p) for t, p in (("motion", 3.9), ("infrared", 4.4), ("light", 2.1),
+                                         ("temperature", 2.8), ("humidity", 3.3), ("sound", 3.0), ("dust", 6.2))]
+        + [Buzzer(f, 90, 4, 120, p) for f, p in ((240, 5.6), (440, 6.1), (880, 6.8))]
+        + [LEDLight(c, 3, 150, 2.2) for c in ("white", "red", "green", "blue", "yellow", "orange", "pink", "aqua", "violet")]
+        + [Switch(t, 4.5, p) for t, p in (("push", 4.6), ("slide", 3.8), ("rocker", 5.1), ("toggle", 4.2))]
+        + [Wire(length, p) for length, p in ((40, 2.4), (60, 3.2), (100, 4.0))]
+    )
+
+    for kit in islice(enumerate_sensor_kits(catalog, 0, 4000), 3):
+        assert kit.is_complete()
+        print(f"${kit.total_price():.2f}  {kit.summary_display()}")
+
+    start = perf_counter()
+    count = sum(1 for _ in sensor_kit_lines(catalog, 0, max_cents, power_quantities=(1, 2, 3, 4),
+                                            max_lights=8, extra_wires=4))
+    print(f"\n{count} variants up to ${max_cents / 100:.2f} in {perf_counter() - start:.2f}s")